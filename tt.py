@@ -1,20 +1,96 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
+import bisect
 import calendar
 import json
 import os
 import platform
-import shutil
+import queue
 import sys
-import subprocess
-import webbrowser
+import threading
 import csv
 import xml.etree.ElementTree as ET
+from collections import Counter
+from functools import lru_cache, partial
+from operator import itemgetter
 from pathlib import Path
-from datetime import datetime, timedelta
+from types import MappingProxyType
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 
+try:
+    import orjson  # Optional - faster JSON parsing/serialization when installed
+except ImportError:
+    orjson = None
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj) -> bytes:
+    """Serialize an object to indented JSON bytes, using orjson when it is available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def _parse_stored_date(value: str) -> date:
+    """Parse a stored YYYY-MM-DD date, also accepting the unpadded form (e.g. 2024-1-5) older files may hold"""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+
+@lru_cache(maxsize=64)
+def _month_calendar(year: int, month: int) -> List[List[int]]:
+    """Get calendar.monthcalendar() weeks for a month (cached; callers must not modify it)"""
+    return calendar.monthcalendar(year, month)
+
 class ModernTravelCalendar:
+    # Calendar button styles indexed by (is_selected << 2) | (has_travel << 1) | is_current
+    _DAY_STYLES = (
+        'Calendar.TButton',               # Plain day
+        'CalendarCurrent.TButton',        # Current day without travel (normal background, red text)
+        'CalendarTravel.TButton',         # Travel day
+        'CalendarTravelCurrent.TButton',  # Travel day that is also current day (blue background, red text)
+        'CalendarSelected.TButton',       # Selection takes priority over travel and current day
+        'CalendarSelected.TButton',
+        'CalendarSelected.TButton',
+        'CalendarSelected.TButton',
+    )
+    
+    # Sort keys for the records list columns, reading fields cached by _hydrate_record
+    _SORT_KEYS = {
+        'Start': itemgetter('_start_dt'),
+        'End': itemgetter('_end_dt'),
+        'Days': itemgetter('_trip_days'),
+        'Location': itemgetter('_location_lower'),
+    }
+    
+    # Modern color scheme, shared read-only by every instance
+    _COLORS = MappingProxyType({
+        'primary': '#2563eb',      # Modern blue
+        'primary_light': '#3b82f6',
+        'primary_dark': '#1d4ed8',
+        'secondary': '#64748b',    # Slate gray
+        'accent': '#06b6d4',       # Cyan
+        'success': '#10b981',      # Green
+        'warning': '#f59e0b',      # Amber
+        'danger': '#ef4444',       # Red
+        'background': '#f8fafc',   # Light gray
+        'surface': '#ffffff',      # White
+        'text': '#1e293b',         # Dark gray
+        'text_light': '#64748b',   # Light gray
+        'border': '#e2e8f0'        # Light border
+    })
+    
+    # Bumped whenever travel_records changes so the report knows to rebuild its rows
+    _records_version = 0
+    
+    # Data directory, cached by get_data_directory
+    _data_directory = None
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Travel Tracker")
@@ -23,31 +99,37 @@ class ModernTravelCalendar:
         # Set calendar to start with Sunday
         calendar.setfirstweekday(6)  # Sunday = 6
 
-        # Modern color scheme
-        self.colors = {
-            'primary': '#2563eb',      # Modern blue
-            'primary_light': '#3b82f6',
-            'primary_dark': '#1d4ed8',
-            'secondary': '#64748b',    # Slate gray
-            'accent': '#06b6d4',       # Cyan
-            'success': '#10b981',      # Green
-            'warning': '#f59e0b',      # Amber
-            'danger': '#ef4444',       # Red
-            'background': '#f8fafc',   # Light gray
-            'surface': '#ffffff',      # White
-            'text': '#1e293b',         # Dark gray
-            'text_light': '#64748b',   # Light gray
-            'border': '#e2e8f0'        # Light border
-        }
+        # Modern color scheme (shared, read-only)
+        self.colors = self._COLORS
         
         self.root.configure(bg=self.colors['background'])
 
         # Data storage - now uses OS-specific paths
         self.data_file = self.get_data_file_path()
         self.config_file = self.get_config_file_path()
-        self.travel_records = self.load_data()
+        
+        # The data file is read on a background thread so the window can paint straight away;
+        # _finish_loading installs the records once it has been parsed
+        self.travel_records = []
+        self._reset_indexes()
+        self._saved_records = None
+        self._data_loaded = False
+        self._load_result = (None, None)
+        self._load_done = threading.Event()
+        self._load_thread = threading.Thread(target=self._load_worker, daemon=True)
+        self._load_buttons = []
+        
+        # Background saving - writes are debounced and run off the UI thread
+        self._save_after_id = None
+        self._save_queue = queue.Queue(maxsize=1)
+        # Write errors are handed back here; the save thread never calls into Tk itself
+        self._save_errors = queue.Queue()
+        threading.Thread(target=self._save_worker, daemon=True).start()
+        self.root.after(500, self._poll_save_errors)
+        self.root.protocol("WM_DELETE_WINDOW", self.exit_application)
         self.selected_start_date = None
         self.selected_end_date = None
+        self._sel_ord = None
         self.selecting_range = False
         
         # Edit mode tracking
@@ -58,6 +140,23 @@ class ModernTravelCalendar:
         self.sort_column = None
         self.sort_reverse = False
         
+        # Day the per-record color tags were last checked for expiry, and a counter
+        # bumped whenever a cached tag is dropped
+        self._color_tag_date = None
+        self._color_tags_version = 0
+        
+        # Today's date and the ordinals derived from it (see _refresh_today)
+        self._today = None
+        
+        # Pending idle-time calendar redraw (see _schedule_calendar_redraw)
+        self._calendar_redraw_id = None
+        
+        # What the report's treeview rows were last built from (see _show_record_rows)
+        self._rows_key = None
+        self._row_iids = {}
+        self._row_records = {}
+        self._filter_refresh_after_id = None
+        
         # Report window tracking
         self.report_window = None
         
@@ -110,20 +209,13 @@ class ModernTravelCalendar:
         self.setup_ui()
         self.update_calendar_display()
         self.update_location_dropdown()
-    
-    def calculate_trip_days(self, start_date_str: str, end_date_str: str) -> int:
-        """Calculate the number of days for a trip (inclusive of both start and end dates)"""
-        try:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d')
-            return (end_date - start_date).days + 1
-        except ValueError:
-            return 0
+        self._load_thread.start()
+        self.root.after(50, self._poll_loading)
     
     def format_date_for_display(self, date_str: str) -> str:
         """Convert YYYY-MM-DD format to user-selected display format for reports"""
         try:
-            date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+            date_obj = _parse_stored_date(date_str)
             format_setting = self.validation_settings.get('report_date_format', 'MM-DD-YYYY')
             
             if format_setting == 'MM/DD/YYYY':
@@ -139,13 +231,13 @@ class ModernTravelCalendar:
             else:
                 # Fallback to default
                 return date_obj.strftime('%m-%d-%Y')
-        except ValueError:
+        except (TypeError, ValueError):
             return date_str  # Return original if parsing fails
     
     def format_date_for_entry(self, date_str: str) -> str:
         """Convert YYYY-MM-DD format to user-selected entry format for input fields"""
         try:
-            date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+            date_obj = _parse_stored_date(date_str)
             format_setting = self.validation_settings.get('entry_date_format', 'MM/DD/YYYY')
             
             if format_setting == 'MM/DD/YYYY':
@@ -161,7 +253,7 @@ class ModernTravelCalendar:
             else:
                 # Fallback to default
                 return date_obj.strftime('%m/%d/%Y')
-        except ValueError:
+        except (TypeError, ValueError):
             return date_str  # Return original if parsing fails
     
     def parse_display_date_to_storage(self, date_str: str) -> str:
@@ -180,7 +272,7 @@ class ModernTravelCalendar:
             for fmt in formats:
                 try:
                     date_obj = datetime.strptime(date_str, fmt)
-                    return date_obj.strftime('%Y-%m-%d')
+                    return date_obj.date().isoformat()
                 except ValueError:
                     continue
             
@@ -204,7 +296,7 @@ class ModernTravelCalendar:
             for fmt in formats:
                 try:
                     date_obj = datetime.strptime(date_str, fmt)
-                    return date_obj.strftime('%Y-%m-%d')
+                    return date_obj.date().isoformat()
                 except ValueError:
                     continue
             
@@ -214,6 +306,13 @@ class ModernTravelCalendar:
     
     def get_data_directory(self):
         """Get the appropriate data directory for the current OS"""
+        # Resolved (and created) once; the data and config paths both ask for it at startup
+        if self._data_directory is None:
+            self._data_directory = self._resolve_data_directory()
+        return self._data_directory
+    
+    def _resolve_data_directory(self):
+        """Work out the data directory for the current OS, creating it if needed"""
         app_name = "TravelTracker"
         
         try:
@@ -259,8 +358,9 @@ class ModernTravelCalendar:
                 print(f"Unknown operating system: {system}. Using current directory for data storage.")
                 return Path.cwd()
             
-            # Create directory if it doesn't exist
-            data_dir.mkdir(parents=True, exist_ok=True)
+            # Create directory if it doesn't exist (a stat is cheaper than mkdir in the usual case)
+            if not data_dir.is_dir():
+                data_dir.mkdir(parents=True, exist_ok=True)
             return data_dir
             
         except Exception as e:
@@ -277,6 +377,7 @@ class ModernTravelCalendar:
         
         if old_data_file.exists() and not new_data_file.exists():
             # Migrate data from old location to new location
+            import shutil  # Only needed for this one-off migration, so not imported at startup
             try:
                 shutil.copy2(old_data_file, new_data_file)
                 print(f"Migrated travel data from {old_data_file} to {new_data_file}")
@@ -341,6 +442,8 @@ class ModernTravelCalendar:
             messagebox.showerror("Backup Error", f"Backup location is not a directory:\n{backup_directory}")
             return
         
+        import shutil
+        
         # Generate timestamp for backup files
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_results = []
@@ -348,6 +451,7 @@ class ModernTravelCalendar:
         try:
             # Backup travel data if selected
             if backup_travel_data:
+                self.flush_saves()
                 if os.path.exists(self.data_file):
                     backup_filename = f"travel_data_backup_{timestamp}.json"
                     backup_filepath = backup_path / backup_filename
@@ -482,27 +586,28 @@ class ModernTravelCalendar:
             return False, []
         
         conflicting_records = []
+        new_start = start_date.date()
+        new_end = end_date.date()
         
         for i, record in enumerate(self.travel_records):
             # Skip the record being edited
             if exclude_index is not None and i == exclude_index:
                 continue
             
-            try:
-                existing_start = datetime.strptime(record['start_date'], '%Y-%m-%d')
-                existing_end = datetime.strptime(record['end_date'], '%Y-%m-%d')
-                
-                # Check for overlap: two ranges overlap if start1 <= end2 and start2 <= end1
-                if start_date <= existing_end and existing_start <= end_date:
-                    conflicting_records.append({
-                        'index': i,
-                        'record': record,
-                        'start_date': existing_start,
-                        'end_date': existing_end
-                    })
-            except ValueError:
+            existing_start = record['_start_dt']
+            existing_end = record['_end_dt']
+            if existing_start is None:
                 # Skip records with invalid dates
                 continue
+            
+            # Check for overlap: two ranges overlap if start1 <= end2 and start2 <= end1
+            if new_start <= existing_end and existing_start <= new_end:
+                conflicting_records.append({
+                    'index': i,
+                    'record': record,
+                    'start_date': existing_start,
+                    'end_date': existing_end
+                })
         
         return len(conflicting_records) > 0, conflicting_records
     
@@ -978,7 +1083,7 @@ class ModernTravelCalendar:
             
             # Write data
             for record in filtered_records:
-                days = self.calculate_trip_days(record['start_date'], record['end_date'])
+                days = record['_trip_days']
                 writer.writerow([
                     self.format_date_for_display(record['start_date']),
                     self.format_date_for_display(record['end_date']),
@@ -1001,7 +1106,7 @@ class ModernTravelCalendar:
             
             # Write data
             for record in filtered_records:
-                days = self.calculate_trip_days(record['start_date'], record['end_date'])
+                days = record['_trip_days']
                 
                 # For TXT files, we'll use CSV writer to handle proper escaping
                 output = io.StringIO()
@@ -1023,7 +1128,7 @@ class ModernTravelCalendar:
         export_data = []
         
         for record in filtered_records:
-            days = self.calculate_trip_days(record['start_date'], record['end_date'])
+            days = record['_trip_days']
             export_record = {
                 'departure_date': self.format_date_for_display(record['start_date']),
                 'return_date': self.format_date_for_display(record['end_date']),
@@ -1043,7 +1148,7 @@ class ModernTravelCalendar:
         root = ET.Element('travel_records')
         
         for record in filtered_records:
-            days = self.calculate_trip_days(record['start_date'], record['end_date'])
+            days = record['_trip_days']
             
             # Create record element
             record_elem = ET.SubElement(root, 'record')
@@ -1174,26 +1279,9 @@ class ModernTravelCalendar:
             if search_text == "search locations, dates, or notes...":
                 search_text = ""
         
-        # Filter records
+        # Filter records (status and year filters are applied while classifying)
         filtered_records = []
-        for record in self.travel_records:
-            # Check status filter
-            record_type = self.get_record_color_tag(record)
-            if record_type not in enabled_filters:
-                continue
-            
-            # Check year filter
-            if selected_year is not None:
-                try:
-                    start_date = datetime.strptime(record['start_date'], '%Y-%m-%d')
-                    end_date = datetime.strptime(record['end_date'], '%Y-%m-%d')
-                    
-                    # Include record if it overlaps with the selected year
-                    if not (start_date.year <= selected_year <= end_date.year):
-                        continue
-                except:
-                    continue
-            
+        for record in self._get_records_with_status(enabled_filters, selected_year):
             # Check travel type filter
             if selected_travel_type is not None:
                 record_travel_type = record.get('travel_type', 'Personal')  # Default to Personal for backward compatibility
@@ -1207,7 +1295,7 @@ class ModernTravelCalendar:
                     record['location'].lower() + " " +
                     record['start_date'].lower() + " " +
                     record['end_date'].lower() + " " +
-                    record.get('comment', '').lower() + " " +
+                    (record.get('comment') or '').lower() + " " +
                     record.get('travel_type', 'Personal').lower()
                 )
                 
@@ -1218,23 +1306,14 @@ class ModernTravelCalendar:
         
         # Apply sorting if there is an active sort column
         if self.sort_column:
-            # Define sort keys for different columns
-            def sort_key(record):
-                if self.sort_column == 'Start':
-                    return record['start_date']
-                elif self.sort_column == 'End':
-                    return record['end_date']
-                elif self.sort_column == 'Days':
-                    return self.calculate_trip_days(record['start_date'], record['end_date'])
-                elif self.sort_column == 'Location':
-                    return record['location'].lower()
-                return ''
-            
-            # Sort the filtered records
-            filtered_records = sorted(filtered_records, key=sort_key, reverse=self.sort_reverse)
+            # Sort the filtered records (they always have valid cached dates). Descending order is the
+            # ascending order reversed, not a stable reverse sort, so it matches sort_records' flip
+            filtered_records.sort(key=self._SORT_KEYS[self.sort_column])
+            if self.sort_reverse:
+                filtered_records.reverse()
         else:
             # Default sort by start date (oldest first) when no column sorting is active
-            filtered_records = sorted(filtered_records, key=lambda x: x['start_date'], reverse=False)
+            filtered_records.sort(key=itemgetter('start_date'))
         
         return filtered_records
     
@@ -1242,68 +1321,28 @@ class ModernTravelCalendar:
     
     def setup_modern_styles(self):
         """Configure modern ttk styles"""
-        style = ttk.Style()
-        
-        # Configure modern button styles
-        style.configure('Modern.TButton',
-                       background=self.colors['primary'],
-                       foreground='white',
-                       borderwidth=0,
-                       focuscolor='none',
-                       padding=(12, 8),
-                       font=('Segoe UI', 10, 'bold'))
-        style.map('Modern.TButton',
-                 background=[('active', self.colors['primary_light']),
-                           ('pressed', self.colors['primary_dark'])],
-                 foreground=[('active', 'white'), ('pressed', 'white')])
-        
-        style.configure('Secondary.TButton',
-                       background=self.colors['secondary'],
-                       foreground='white',
-                       borderwidth=0,
-                       focuscolor='none',
-                       padding=(12, 8),
-                       font=('Segoe UI', 10, 'bold'))
-        style.map('Secondary.TButton',
-                 background=[('active', '#475569'),
-                           ('pressed', '#334155')],
-                 foreground=[('active', 'white'), ('pressed', 'white')])
-        
-        style.configure('Success.TButton',
-                       background=self.colors['success'],
-                       foreground='white',
-                       borderwidth=0,
-                       focuscolor='none',
-                       padding=(12, 8),
-                       font=('Segoe UI', 10, 'bold'))
-        style.map('Success.TButton',
-                 background=[('active', '#059669'),
-                           ('pressed', '#047857')],
-                 foreground=[('active', 'white'), ('pressed', 'white')])
-        
-        style.configure('Danger.TButton',
-                       background=self.colors['danger'],
-                       foreground='white',
-                       borderwidth=0,
-                       focuscolor='none',
-                       padding=(12, 8),
-                       font=('Segoe UI', 10, 'bold'))
-        style.map('Danger.TButton',
-                 background=[('active', '#dc2626'),
-                           ('pressed', '#b91c1c')],
-                 foreground=[('active', 'white'), ('pressed', 'white')])
-        
-        style.configure('Warning.TButton',
-                       background=self.colors['warning'],
-                       foreground='white',
-                       borderwidth=0,
-                       focuscolor='none',
-                       padding=(12, 8),
-                       font=('Segoe UI', 10, 'bold'))
-        style.map('Warning.TButton',
-                 background=[('active', '#d97706'),
-                           ('pressed', '#b45309')],
-                 foreground=[('active', 'white'), ('pressed', 'white')])
+        style = ttk.Style(self.root)
+        
+        # Configure modern button styles: background, active and pressed colors per style
+        button_colors = {
+            'Modern': (self.colors['primary'], self.colors['primary_light'], self.colors['primary_dark']),
+            'Secondary': (self.colors['secondary'], '#475569', '#334155'),
+            'Success': (self.colors['success'], '#059669', '#047857'),
+            'Danger': (self.colors['danger'], '#dc2626', '#b91c1c'),
+            'Warning': (self.colors['warning'], '#d97706', '#b45309'),
+        }
+        for name, (background, active, pressed) in button_colors.items():
+            style.configure(f'{name}.TButton',
+                           background=background,
+                           foreground='white',
+                           borderwidth=0,
+                           focuscolor='none',
+                           padding=(12, 8),
+                           font=('Segoe UI', 10, 'bold'))
+            style.map(f'{name}.TButton',
+                     background=[('active', active),
+                               ('pressed', pressed)],
+                     foreground=[('active', 'white'), ('pressed', 'white')])
         
         # Calendar button styles
         style.configure('Calendar.TButton',
@@ -1317,6 +1356,48 @@ class ModernTravelCalendar:
                  background=[('active', self.colors['primary_light']),
                            ('pressed', self.colors['primary'])])
         
+        self._configure_calendar_day_styles(style)
+        
+        # Navigation button styles
+        style.configure('Nav.TButton',
+                       background=self.colors['surface'],
+                       foreground=self.colors['text'],
+                       borderwidth=1,
+                       relief='solid',
+                       padding=(16, 8),
+                       font=('Segoe UI', 12, 'bold'))
+        style.map('Nav.TButton',
+                 background=[('active', self.colors['border']),
+                           ('pressed', self.colors['secondary'])])
+        
+        # Frame styles
+        style.configure('Card.TLabelframe',
+                       background=self.colors['surface'],
+                       borderwidth=2,
+                       relief='solid',
+                       padding=20)
+        style.configure('Card.TLabelframe.Label',
+                       background=self.colors['surface'],
+                       foreground=self.colors['text'],
+                       font=('Segoe UI', 12, 'bold'))
+        
+        # Entry styles
+        style.configure('Modern.TEntry',
+                       fieldbackground=self.colors['surface'],
+                       borderwidth=2,
+                       relief='solid',
+                       insertcolor=self.colors['primary'],
+                       padding=(12, 8))
+        
+        # Combobox styles
+        style.configure('Modern.TCombobox',
+                       fieldbackground=self.colors['surface'],
+                       borderwidth=2,
+                       relief='solid',
+                       padding=(12, 8))
+    
+    def _configure_calendar_day_styles(self, style: ttk.Style):
+        """Configure the calendar day styles that use the user-selected colors"""
         # Get user-selected colors
         travel_days_color = self.get_travel_days_color_hex(self.validation_settings.get('travel_days_color', 'Cyan'))
         selected_dates_color = self.get_selected_dates_color_hex(self.validation_settings.get('selected_dates_color', 'Orange'))
@@ -1375,44 +1456,6 @@ class ModernTravelCalendar:
                            ('pressed', travel_days_color)],
                  foreground=[('active', today_color),
                            ('pressed', today_color)])
-        
-        # Navigation button styles
-        style.configure('Nav.TButton',
-                       background=self.colors['surface'],
-                       foreground=self.colors['text'],
-                       borderwidth=1,
-                       relief='solid',
-                       padding=(16, 8),
-                       font=('Segoe UI', 12, 'bold'))
-        style.map('Nav.TButton',
-                 background=[('active', self.colors['border']),
-                           ('pressed', self.colors['secondary'])])
-        
-        # Frame styles
-        style.configure('Card.TLabelframe',
-                       background=self.colors['surface'],
-                       borderwidth=2,
-                       relief='solid',
-                       padding=20)
-        style.configure('Card.TLabelframe.Label',
-                       background=self.colors['surface'],
-                       foreground=self.colors['text'],
-                       font=('Segoe UI', 12, 'bold'))
-        
-        # Entry styles
-        style.configure('Modern.TEntry',
-                       fieldbackground=self.colors['surface'],
-                       borderwidth=2,
-                       relief='solid',
-                       insertcolor=self.colors['primary'],
-                       padding=(12, 8))
-        
-        # Combobox styles
-        style.configure('Modern.TCombobox',
-                       fieldbackground=self.colors['surface'],
-                       borderwidth=2,
-                       relief='solid',
-                       padding=(12, 8))
     
     def setup_menu(self):
         """Setup the application menu bar"""
@@ -2127,7 +2170,8 @@ class ModernTravelCalendar:
                 self.save_config()
                 
                 # Refresh calendar styles to apply color changes immediately
-                self.setup_modern_styles()
+                # (only the calendar day styles depend on the color settings)
+                self._configure_calendar_day_styles(ttk.Style(self.root))
                 self.update_calendar_display()
                 self.update_calendar_legend()  # Update legend with new color
                 
@@ -2150,6 +2194,8 @@ class ModernTravelCalendar:
     
     def open_data_location(self):
         """Open the directory containing the travel data file"""
+        import subprocess
+        
         data_dir = Path(self.data_file).parent
         
         try:
@@ -2178,6 +2224,8 @@ class ModernTravelCalendar:
     
     def open_documentation(self):
         """Open the documentation URL in the default web browser"""
+        import webbrowser
+        
         documentation_url = "https://github.com/jackworthen/travel-tracker"
         
         try:
@@ -2190,6 +2238,8 @@ class ModernTravelCalendar:
     
     def exit_application(self):
         """Exit the application"""
+        # Make sure pending edits reach disk before the save thread is torn down
+        self.flush_saves()
         self.root.quit()
         self.root.destroy()
     
@@ -2306,11 +2356,13 @@ class ModernTravelCalendar:
         button_frame.columnconfigure(0, weight=1)
         button_frame.columnconfigure(1, weight=1)
         
+        # Saving and reporting stay disabled until _finish_loading has installed the records
         save_btn = tk.Button(button_frame, text="💾 Save Travel",
                             bg=self.colors['success'], fg='white',
                             font=('Segoe UI', 10, 'bold'),
                             relief='flat', bd=0, padx=12, pady=8,
                             activebackground='#059669', activeforeground='white',
+                            state=tk.DISABLED,
                             command=self.add_travel)
         save_btn.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, 5))
         
@@ -2327,8 +2379,10 @@ class ModernTravelCalendar:
                               font=('Segoe UI', 10, 'bold'),
                               relief='flat', bd=0, padx=12, pady=8,
                               activebackground=self.colors['primary_light'], activeforeground='white',
+                              state=tk.DISABLED,
                               command=self.show_report)
         report_btn.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
+        self._load_buttons = [save_btn, report_btn]
         
         analytics_btn = tk.Button(button_frame, text="📈 Analytics Dashboard",
                                  bg='#8b5cf6', fg='white',  # Purple color
@@ -2368,6 +2422,36 @@ class ModernTravelCalendar:
         self.calendar_frame_inner = tk.Frame(calendar_container, bg=self.colors['surface'])
         self.calendar_frame_inner.pack(expand=True)
         
+        # Day headers - Updated to start with Sunday
+        days = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat']
+        for i, day in enumerate(days):
+            label = tk.Label(self.calendar_frame_inner, text=day, 
+                           font=('Segoe UI', 10, 'bold'),
+                           fg=self.colors['text_light'],
+                           bg=self.colors['surface'],
+                           width=8, height=2)
+            label.grid(row=0, column=i, padx=2, pady=2)
+        
+        # Date buttons for a full 6-week grid are created once and reconfigured on every repaint
+        self._day_buttons = []
+        self._day_button_visible = []
+        self._cell_days = [0] * 42  # Day of the displayed month shown in each cell (0 = empty)
+        self._btn_by_day = {}  # Day of the displayed month -> its button
+        for week_num in range(6):
+            for day_num in range(7):
+                cell = week_num * 7 + day_num
+                btn = ttk.Button(self.calendar_frame_inner, style='Calendar.TButton',
+                                 command=partial(self._on_day_cell_clicked, cell))
+                btn.grid(row=week_num + 1, column=day_num, padx=2, pady=2, sticky='nsew')
+                btn.grid_remove()  # Hidden until a month places a day in this cell
+                self._day_buttons.append(btn)
+                self._day_button_visible.append(False)
+        
+        # Configure grid weights for responsive layout
+        for i in range(7):
+            self.calendar_frame_inner.columnconfigure(i, weight=1)
+            self.calendar_frame_inner.rowconfigure(i, weight=1)
+        
         # Travel days counter (between calendar and trips for month)
         travel_days_frame = tk.Frame(calendar_frame, bg=self.colors['surface'])
         travel_days_frame.pack(fill=tk.X, pady=(15, 10))
@@ -2431,69 +2515,292 @@ class ModernTravelCalendar:
     
     def get_trips_for_month(self, year: int, month: int) -> List[Dict]:
         """Get travel records that occur within the specified month and year"""
-        month_trips = []
+        # Get the first and last day of the month as ordinals
+        month_start = date(year, month, 1).toordinal()
+        month_end = month_start + calendar.monthrange(year, month)[1] - 1
         
-        # Get the first and last day of the month
-        month_start = datetime(year, month, 1)
-        if month == 12:
-            month_end = datetime(year + 1, 1, 1) - timedelta(days=1)
+        # Already in start date order
+        return self._get_records_overlapping(month_start, month_end)
+    
+    def _read_data_file(self) -> Optional[List[Dict]]:
+        """Read and parse the JSON data file, or return None if there is none yet"""
+        if not os.path.exists(self.data_file):
+            return None
+        with open(self.data_file, 'rb') as f:
+            return _json_loads(f.read())
+    
+    def _load_worker(self):
+        """Read the data file (runs on the load thread); _poll_loading picks up the result"""
+        try:
+            self._load_result = (self._read_data_file(), None)
+        except Exception as e:
+            self._load_result = (None, e)
+        # The load thread never calls into Tk itself
+        self._load_done.set()
+    
+    def _poll_loading(self):
+        """Install the loaded records on the UI thread once the load thread is done"""
+        if self._load_done.is_set():
+            self._finish_loading()
         else:
-            month_end = datetime(year, month + 1, 1) - timedelta(days=1)
-        
-        for record in self.travel_records:
-            try:
-                trip_start = datetime.strptime(record['start_date'], '%Y-%m-%d')
-                trip_end = datetime.strptime(record['end_date'], '%Y-%m-%d')
-                
-                # Check if trip overlaps with the month
-                if trip_start <= month_end and trip_end >= month_start:
-                    month_trips.append(record)
-                    
-            except ValueError:
-                # Skip records with invalid dates
-                continue
-        
-        # Sort trips by start date
-        month_trips.sort(key=lambda x: x['start_date'])
-        return month_trips
+            self.root.after(50, self._poll_loading)
+    
+    def _finish_loading(self):
+        """Install the records read by the load thread and refresh the views that show them"""
+        if self._data_loaded:
+            return
+        self._load_done.wait()
+        self._data_loaded = True
+        
+        self.travel_records = self.load_data(*self._load_result)
+        if self._load_error is not None:
+            messagebox.showerror("Load Error",
+                                 f"Could not load travel data from:\n{self.data_file}\n\n"
+                                 f"Error: {self._load_error}\n\n"
+                                 "Changes will not be saved until the file is fixed or moved away.")
+        
+        for button in self._load_buttons:
+            button.config(state=tk.NORMAL)
+        self._schedule_calendar_redraw()
+        self.update_location_dropdown()
     
-    def load_data(self) -> List[Dict]:
-        """Load travel data from JSON file"""
-        if os.path.exists(self.data_file):
+    def load_data(self, data: Optional[List[Dict]], error: Optional[Exception] = None) -> List[Dict]:
+        """Build the travel records and indexes from the parsed data file"""
+        self._reset_indexes()
+        # A file that could not be loaded must never be overwritten (see _queue_save)
+        self._load_error = error
+        if error is not None:
+            print(f"Error loading data: {error}")
+        elif data is not None:
             try:
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    # Ensure backward compatibility - add travel_type if missing
-                    for record in data:
-                        if 'travel_type' not in record:
-                            record['travel_type'] = 'Personal'  # Default to Personal for old records
-                    return data
+                # Ensure backward compatibility - add travel_type if missing
+                upgraded = False
+                for record in data:
+                    if 'travel_type' not in record:
+                        record['travel_type'] = 'Personal'  # Default to Personal for old records
+                        upgraded = True
+                    # Fill the date and location indexes in the same pass
+                    stored_dates = (record.get('start_date'), record.get('end_date'))
+                    self._hydrate_record(record)
+                    self._index_record(record)
+                    if (record['start_date'], record['end_date']) != stored_dates:
+                        upgraded = True  # Dates were normalised to YYYY-MM-DD
+                # Remember what is on disk so saves with no changes can be skipped
+                # (upgraded files still get rewritten with the filled-in defaults and normalised dates)
+                self._saved_records = None if upgraded else self._snapshot_records(data)
+                return data
             except Exception as e:
                 print(f"Error loading data: {e}")
-                return []
+                self._load_error = e
+                self._reset_indexes()
+        self._saved_records = None
         return []
     
     def save_data(self):
-        """Save travel data to JSON file"""
+        """Schedule a background save of the travel data"""
+        # Debounce so a burst of edits results in a single file write
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(300, self._queue_save)
+    
+    def flush_saves(self):
+        """Queue any pending save immediately and wait until it is written"""
+        # Nothing can be saved before the data file has finished loading
+        self._finish_loading()
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._queue_save()
+        self._save_queue.join()
+        self._show_save_errors()
+    
+    def _queue_save(self):
+        """Hand a snapshot of the records to the save thread"""
+        self._save_after_id = None
+        if not self._data_loaded:
+            # Saving now would overwrite the file before it has been read
+            return
+        if self._load_error is not None:
+            # The data file could not be read, so writing would replace it with only the new records
+            print(f"Not saving: the data file could not be loaded ({self._load_error})")
+            return
+        records = self._snapshot_records(self.travel_records)
+        
+        # Skip the write when nothing changed since the last save (e.g. an edit saved unchanged)
+        if records == self._saved_records:
+            return
+        self._saved_records = records
+        
+        # Replace any snapshot the save thread has not picked up yet
         try:
-            with open(self.data_file, 'w') as f:
-                json.dump(self.travel_records, f, indent=2)
-        except Exception as e:
-            print(f"Error saving data: {e}")
-            messagebox.showerror("Save Error", f"Could not save data: {e}")
+            self._save_queue.get_nowait()
+            self._save_queue.task_done()
+        except queue.Empty:
+            pass
+        self._save_queue.put_nowait(records)
+    
+    def _save_worker(self):
+        """Write queued record snapshots to disk (runs on the save thread)"""
+        while True:
+            records = self._save_queue.get()
+            try:
+                self._write_data(records)
+            except Exception as e:
+                print(f"Error saving data: {e}")
+                # Calling Tk from here would block until the UI thread is free, and that thread may be
+                # waiting in flush_saves - so report the error through a queue; _show_save_errors then
+                # resets _saved_records, which only the UI thread touches
+                self._save_errors.put(e)
+            finally:
+                self._save_queue.task_done()
+    
+    def _show_save_errors(self):
+        """Show any errors reported by the save thread"""
+        while True:
+            try:
+                error = self._save_errors.get_nowait()
+            except queue.Empty:
+                return
+            # Forget the failed snapshot so the next save writes again
+            self._saved_records = None
+            messagebox.showerror("Save Error", f"Could not save data: {error}")
+    
+    def _poll_save_errors(self):
+        """Periodically surface save thread errors on the UI thread"""
+        self._show_save_errors()
+        self.root.after(500, self._poll_save_errors)
+    
+    def _snapshot_records(self, records: List[Dict]) -> List[Dict]:
+        """Copy records without their cached fields (underscore-prefixed) so only user data is saved"""
+        return [{key: value for key, value in record.items() if not key.startswith('_')}
+                for record in records]
+    
+    def _write_data(self, records: List[Dict]):
+        """Atomically write records to the data file"""
+        # Write to a temporary file first so a crash never leaves a truncated data file
+        temp_file = self.data_file + '.tmp'
+        with open(temp_file, 'wb') as f:
+            f.write(_json_dumps(records))
+        os.replace(temp_file, self.data_file)
+    
+    def _hydrate_record(self, record: Dict) -> Dict:
+        """Cache parsed dates and the display comment on a record so hot paths don't recompute them"""
+        # Comments longer than 50 characters are truncated for the records list; a null or
+        # non-text comment from a hand-edited file is coerced like the location below
+        comment = record.get('comment')
+        if not isinstance(comment, str):
+            comment = '' if comment is None else str(comment)
+            record['comment'] = comment
+        record['_display_comment'] = comment[:47] + "..." if comment[50:] else comment
+        # Locations are stored stripped (older files may not be) and interned so repeated places
+        # share one string and set/dict lookups hit the identity fast path; a missing or
+        # non-text location from a hand-edited file is coerced rather than failing the load
+        location = record.get('location')
+        if not isinstance(location, str):
+            location = '' if location is None else str(location)
+        record['location'] = sys.intern(location.strip())
+        record['_location_lower'] = record['location'].lower()
+        
+        try:
+            record['_start_dt'] = _parse_stored_date(record['start_date'])
+            record['_end_dt'] = _parse_stored_date(record['end_date'])
+            record['_trip_days'] = (record['_end_dt'] - record['_start_dt']).days + 1
+            # Store the dates in canonical YYYY-MM-DD form (load_data saves any that changed)
+            record['start_date'] = record['_start_dt'].isoformat()
+            record['end_date'] = record['_end_dt'].isoformat()
+            # Key for the start-date ordered view, built from the parsed date so the range
+            # lookups always agree with the travel date set
+            record['_start_key'] = record['start_date']
+        except (KeyError, TypeError, ValueError):
+            # Invalid dates are cached as None and skipped by the date-based scans
+            record['_start_dt'] = None
+            record['_end_dt'] = None
+            record['_trip_days'] = 0
+            record['_start_key'] = ''
+        return record
+    
+    def _reset_indexes(self):
+        """Clear the travel date and location indexes"""
+        self._travel_days = set()
+        self._starts = []
+        self._ends = []
+        self._records_by_start = []
+        self._start_keys = []
+        self._record_index = {}  # id(record) -> position in travel_records
+        self._max_trip_days = 0
+        self._available_years = None  # (records version, years) cached by get_available_years
+        self._loc_counts = Counter()
+        # Sorted unique locations, built on the next dropdown update and then kept in order incrementally
+        self._locations_sorted = None
+        self._locations_changed = True
+    
+    def _index_record(self, record: Dict):
+        """Add a hydrated record to the travel date and location indexes"""
+        self._records_version += 1
+        self._add_travel_days(record)
+        # The ordinal lists are aligned with travel_records, so this record sits at the end
+        self._record_index[id(record)] = len(self._starts) - 1
+        self._count_location(record['location'], 1)
+        
+        # Insert into the start-date ordered view after any records with the same start date
+        position = bisect.bisect_right(self._start_keys, record['_start_key'])
+        self._start_keys.insert(position, record['_start_key'])
+        self._records_by_start.insert(position, record)
+    
+    def _add_travel_days(self, record: Dict):
+        """Add the dates covered by a record to the travel date index and ordinal range lists"""
+        start_date = record['_start_dt']
+        end_date = record['_end_dt']
+        if start_date is None:
+            # Keep the ordinal lists aligned with the records; an empty range never matches
+            self._starts.append(1)
+            self._ends.append(0)
+            return
+        
+        self._starts.append(start_date.toordinal())
+        self._ends.append(end_date.toordinal())
+        self._max_trip_days = max(self._max_trip_days, record['_trip_days'])
+        for offset in range((end_date - start_date).days + 1):
+            self._travel_days.add(start_date + timedelta(days=offset))
+    
+    def _rebuild_travel_index(self):
+        """Rebuild the set of dates covered by any travel record"""
+        self._records_version += 1
+        self._travel_days = set()
+        self._starts = []
+        self._ends = []
+        self._max_trip_days = 0
+        for record in self.travel_records:
+            self._add_travel_days(record)
+        self._record_index = {id(record): i for i, record in enumerate(self.travel_records)}
+        
+        self._records_by_start = sorted(self.travel_records, key=itemgetter('_start_key'))
+        self._start_keys = [record['_start_key'] for record in self._records_by_start]
+    
+    def _get_records_overlapping(self, first_ordinal: int, last_ordinal: int) -> List[Dict]:
+        """Get the records, in start date order, whose dates overlap an inclusive ordinal range"""
+        # Only trips starting less than the longest trip's length before the range can reach it,
+        # so binary search the start-ordered view for that window (ISO keys sort by date)
+        window_start = date.fromordinal(max(first_ordinal - self._max_trip_days + 1, 1)).isoformat()
+        window_end = date.fromordinal(last_ordinal).isoformat()
+        low = bisect.bisect_left(self._start_keys, window_start)
+        high = bisect.bisect_right(self._start_keys, window_end, low)
+        
+        return [record for record in self._records_by_start[low:high]
+                if record['_end_dt'] is not None and record['_end_dt'].toordinal() >= first_ordinal]
     
     def get_available_years(self) -> List[int]:
         """Get list of years from travel records"""
-        years = set()
-        for record in self.travel_records:
-            try:
-                start_year = datetime.strptime(record['start_date'], '%Y-%m-%d').year
-                end_year = datetime.strptime(record['end_date'], '%Y-%m-%d').year
-                years.add(start_year)
-                years.add(end_year)
-            except:
-                continue
-        return sorted(list(years), reverse=True)  # Most recent years first
+        # Rescan only when the records have changed since the last call
+        if self._available_years is None or self._available_years[0] != self._records_version:
+            years = set()
+            for record in self.travel_records:
+                if record['_start_dt'] is None:
+                    # Skip records with invalid dates
+                    continue
+                years.add(record['_start_dt'].year)
+                years.add(record['_end_dt'].year)
+            self._available_years = (self._records_version, sorted(years, reverse=True))  # Most recent years first
+        return list(self._available_years[1])
     
     def get_default_year_selection(self, available_years):
         """Get the default year selection based on user preference"""
@@ -2512,79 +2819,90 @@ class ModernTravelCalendar:
             # Fallback for unknown preference
             return "All Years"
     
+    def _count_location(self, location: str, delta: int):
+        """Adjust a location's record count, flagging the dropdown when the unique set changes"""
+        # Locations are already stripped by _hydrate_record
+        if not location:
+            return
+        
+        count = self._loc_counts[location] + delta
+        if count > 0:
+            if location not in self._loc_counts:
+                self._locations_changed = True
+                if self._locations_sorted is not None:
+                    bisect.insort(self._locations_sorted, location)
+            self._loc_counts[location] = count
+        elif location in self._loc_counts:
+            del self._loc_counts[location]
+            self._locations_changed = True
+            if self._locations_sorted is not None:
+                del self._locations_sorted[bisect.bisect_left(self._locations_sorted, location)]
+    
     def update_location_dropdown(self):
         """Update the location combobox with unique locations from travel records"""
-        locations = set()
-        for record in self.travel_records:
-            if record['location'].strip():
-                locations.add(record['location'])
-        
-        sorted_locations = sorted(list(locations))
-        self.location_entry['values'] = sorted_locations
+        # Only push new values to the combobox when the set of unique locations changed
+        if self._locations_changed:
+            if self._locations_sorted is None:
+                self._locations_sorted = sorted(self._loc_counts)
+            self.location_entry['values'] = self._locations_sorted
+            self._locations_changed = False
+    
+    def _schedule_calendar_redraw(self):
+        """Coalesce the redraws requested during one burst of events into a single idle-time render"""
+        if self._calendar_redraw_id is None:
+            self._calendar_redraw_id = self.root.after_idle(self._run_calendar_redraw)
+    
+    def _run_calendar_redraw(self):
+        """Render the calendar for a redraw scheduled by _schedule_calendar_redraw"""
+        self._calendar_redraw_id = None
+        self.update_calendar_display()
     
     def update_calendar_display(self):
         """Update the calendar display for current month/year"""
-        # Clear existing calendar
-        for widget in self.calendar_frame_inner.winfo_children():
-            widget.destroy()
-        
         # Update month label
         month_name = calendar.month_name[self.current_month]
         self.month_label.config(text=f"{month_name} {self.current_year}")
         
-        # Day headers - Updated to start with Sunday
-        days = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat']
-        for i, day in enumerate(days):
-            label = tk.Label(self.calendar_frame_inner, text=day, 
-                           font=('Segoe UI', 10, 'bold'),
-                           fg=self.colors['text_light'],
-                           bg=self.colors['surface'],
-                           width=8, height=2)
-            label.grid(row=0, column=i, padx=2, pady=2)
-        
         # Get calendar data
-        cal = calendar.monthcalendar(self.current_year, self.current_month)
-        
-        # Create date buttons
-        for week_num, week in enumerate(cal):
+        cal = _month_calendar(self.current_year, self.current_month)
+        
+        # Work out travel, selection and today for the whole month once per repaint
+        self._travel_mask = self._get_travel_mask()
+        self._selected_mask = self._get_selected_mask()
+        today = date.today()
+        if (today.year, today.month) == (self.current_year, self.current_month):
+            self._current_day = today.day
+        else:
+            self._current_day = 0
+        
+        # Reconfigure the pre-built date buttons
+        self._btn_by_day = {}
+        day_styles = self._DAY_STYLES
+        travel_mask = self._travel_mask
+        selected_mask = self._selected_mask
+        current_day = self._current_day
+        for week_num in range(6):
+            week = cal[week_num] if week_num < len(cal) else [0] * 7
             for day_num, day in enumerate(week):
+                cell = week_num * 7 + day_num
+                btn = self._day_buttons[cell]
+                
+                self._cell_days[cell] = day
                 if day == 0:
-                    # Empty cell for days not in current month
-                    label = tk.Label(self.calendar_frame_inner, text="",
-                                   bg=self.colors['surface'], width=8, height=2)
-                    label.grid(row=week_num + 1, column=day_num, padx=2, pady=2)
+                    # Hide cells for days not in current month
+                    if self._day_button_visible[cell]:
+                        btn.grid_remove()
+                        self._day_button_visible[cell] = False
                 else:
-                    date_obj = datetime(self.current_year, self.current_month, day)
-                    
-                    # Check status
-                    has_travel = self.date_has_travel(date_obj)
-                    is_selected = self.date_is_selected(date_obj)
-                    is_current = self.date_is_current(date_obj)
-                    
-                    # UPDATED: Determine style with new priority logic
-                    if is_selected:
-                        style = 'CalendarSelected.TButton'
-                    elif has_travel and is_current:
-                        # NEW: Travel day that is also current day (blue background, red text)
-                        style = 'CalendarTravelCurrent.TButton'
-                    elif has_travel:
-                        style = 'CalendarTravel.TButton'
-                    elif is_current:
-                        # UPDATED: Current day without travel (normal background, red text)
-                        style = 'CalendarCurrent.TButton'
-                    else:
-                        style = 'Calendar.TButton'
+                    style = day_styles[((selected_mask >> day) & 1) << 2
+                                       | ((travel_mask >> day) & 1) << 1
+                                       | (day == current_day)]
+                    self._btn_by_day[day] = btn
                     
-                    btn = ttk.Button(self.calendar_frame_inner, text=str(day), 
-                                   style=style,
-                                   command=lambda d=day: self.date_clicked(d))
-                    btn.grid(row=week_num + 1, column=day_num, padx=2, pady=2, sticky='nsew')
-        
-        # Configure grid weights for responsive layout
-        for i in range(7):
-            self.calendar_frame_inner.columnconfigure(i, weight=1)
-        for i in range(len(cal) + 1):
-            self.calendar_frame_inner.rowconfigure(i, weight=1)
+                    btn.configure(text=str(day), style=style)
+                    if not self._day_button_visible[cell]:
+                        btn.grid()
+                        self._day_button_visible[cell] = True
         
         # Update travel days counter
         travel_days = self.get_travel_days_for_month(self.current_year, self.current_month)
@@ -2624,105 +2942,130 @@ class ModernTravelCalendar:
             # CHANGE: Instead of showing "No trips in [month]", set text to empty
             self.trips_for_month_label.config(text="")
     
+    def _get_day_style(self, day: int) -> str:
+        """Get the calendar button style for a day of the displayed month"""
+        is_selected = (self._selected_mask >> day) & 1
+        has_travel = (self._travel_mask >> day) & 1
+        is_current = day == self._current_day
+        return self._DAY_STYLES[is_selected << 2 | has_travel << 1 | is_current]
+    
+    def _on_day_cell_clicked(self, cell: int):
+        """Handle a click on a calendar cell by dispatching the day it currently shows"""
+        # Bring the cells up to date first if a month change is still waiting to be drawn
+        if self._calendar_redraw_id is not None:
+            self.root.after_cancel(self._calendar_redraw_id)
+            self._run_calendar_redraw()
+        
+        day = self._cell_days[cell]
+        if day:
+            self.date_clicked(day)
+    
+    def _get_travel_mask(self) -> int:
+        """Get a bitmask of the displayed month's travel days (bit N set for day N)"""
+        days_in_month = calendar.monthrange(self.current_year, self.current_month)[1]
+        mask = 0
+        for day in range(1, days_in_month + 1):
+            if date(self.current_year, self.current_month, day) in self._travel_days:
+                mask |= 1 << day
+        return mask
+    
+    def _get_selected_mask(self) -> int:
+        """Get a bitmask of the displayed month's selected days (bit N set for day N)"""
+        if self._sel_ord is None:
+            return 0
+        
+        # Clip the selected ordinals to the month, then convert them to day numbers
+        days_in_month = calendar.monthrange(self.current_year, self.current_month)[1]
+        month_offset = date(self.current_year, self.current_month, 1).toordinal() - 1
+        first_day = max(self._sel_ord[0] - month_offset, 1)
+        last_day = min(self._sel_ord[1] - month_offset, days_in_month)
+        if first_day > last_day:
+            return 0
+        
+        # Set bits first_day through last_day
+        return ((1 << (last_day + 1)) - 1) & ~((1 << first_day) - 1)
+    
+    def _update_selection_ordinals(self):
+        """Cache the selected range as (first, last) date ordinals, or None when nothing is selected"""
+        if not self.selected_start_date:
+            self._sel_ord = None
+            return
+        
+        start = self.selected_start_date.toordinal()
+        end = self.selected_end_date.toordinal() if self.selected_end_date else start
+        self._sel_ord = (start, end)
+    
     def get_travel_days_for_month(self, year: int, month: int) -> int:
         """Calculate total travel days for a specific month and year"""
         travel_days = 0
         
-        # Get the first and last day of the month
-        month_start = datetime(year, month, 1)
-        if month == 12:
-            month_end = datetime(year + 1, 1, 1) - timedelta(days=1)
-        else:
-            month_end = datetime(year, month + 1, 1) - timedelta(days=1)
+        # Get the first and last day of the month as ordinals
+        month_start = date(year, month, 1).toordinal()
+        month_end = month_start + calendar.monthrange(year, month)[1] - 1
         
-        for record in self.travel_records:
-            try:
-                trip_start = datetime.strptime(record['start_date'], '%Y-%m-%d')
-                trip_end = datetime.strptime(record['end_date'], '%Y-%m-%d')
-                
-                # Calculate overlap between trip and month
-                overlap_start = max(trip_start, month_start)
-                overlap_end = min(trip_end, month_end)
-                
-                # If there's an overlap, count the days
-                if overlap_start <= overlap_end:
-                    days_in_month = (overlap_end - overlap_start).days + 1
-                    travel_days += days_in_month
-                    
-            except ValueError:
-                # Skip records with invalid dates
-                continue
+        for record in self._get_records_overlapping(month_start, month_end):
+            # Calculate overlap between trip and month
+            overlap_start = max(record['_start_dt'].toordinal(), month_start)
+            overlap_end = min(record['_end_dt'].toordinal(), month_end)
+            
+            # If there's an overlap, count the days
+            if overlap_start <= overlap_end:
+                travel_days += overlap_end - overlap_start + 1
         
         return travel_days
     
-    def date_has_travel(self, date_obj: datetime) -> bool:
-        """Check if a date has travel records"""
-        for record in self.travel_records:
-            start_date = datetime.strptime(record['start_date'], '%Y-%m-%d')
-            end_date = datetime.strptime(record['end_date'], '%Y-%m-%d')
-            if start_date <= date_obj <= end_date:
-                return True
-        return False
-    
-    def date_is_selected(self, date_obj: datetime) -> bool:
-        """Check if a date is in the selected range"""
-        if not self.selected_start_date:
-            return False
-        
-        if self.selected_end_date:
-            return self.selected_start_date <= date_obj <= self.selected_end_date
-        else:
-            return date_obj == self.selected_start_date
-    
-    def date_is_current(self, date_obj: datetime) -> bool:
-        """Check if a date is the current date (today)"""
-        current_date = datetime.now().date()
-        return date_obj.date() == current_date
-    
     def date_clicked(self, day: int):
         """Handle date button clicks"""
         clicked_date = datetime(self.current_year, self.current_month, day)
+        previously_selected = self._selected_mask
         
         if not self.selected_start_date:
             # First click - set start date
             self.selected_start_date = clicked_date
             self.start_date_entry.delete(0, tk.END)
-            self.start_date_entry.insert(0, self.format_date_for_entry(clicked_date.strftime('%Y-%m-%d')))
+            self.start_date_entry.insert(0, self.format_date_for_entry(clicked_date.date().isoformat()))
             self.selecting_range = True
         elif self.selecting_range:
             # Second click - set end date
             if clicked_date >= self.selected_start_date:
                 self.selected_end_date = clicked_date
                 self.end_date_entry.delete(0, tk.END)
-                self.end_date_entry.insert(0, self.format_date_for_entry(clicked_date.strftime('%Y-%m-%d')))
+                self.end_date_entry.insert(0, self.format_date_for_entry(clicked_date.date().isoformat()))
             else:
                 # If clicked date is before start date, swap them
                 self.selected_end_date = self.selected_start_date
                 self.selected_start_date = clicked_date
                 self.start_date_entry.delete(0, tk.END)
-                self.start_date_entry.insert(0, self.format_date_for_entry(clicked_date.strftime('%Y-%m-%d')))
+                self.start_date_entry.insert(0, self.format_date_for_entry(clicked_date.date().isoformat()))
                 self.end_date_entry.delete(0, tk.END)
-                self.end_date_entry.insert(0, self.format_date_for_entry(self.selected_end_date.strftime('%Y-%m-%d')))
+                self.end_date_entry.insert(0, self.format_date_for_entry(self.selected_end_date.date().isoformat()))
             self.selecting_range = False
         else:
             # Start new selection
             self.selected_start_date = clicked_date
             self.selected_end_date = None
             self.start_date_entry.delete(0, tk.END)
-            self.start_date_entry.insert(0, self.format_date_for_entry(clicked_date.strftime('%Y-%m-%d')))
+            self.start_date_entry.insert(0, self.format_date_for_entry(clicked_date.date().isoformat()))
             self.end_date_entry.delete(0, tk.END)
             self.selecting_range = True
         
-        self.update_calendar_display()
+        # A click only changes the selection, so restyle just the cells whose state flipped
+        self._update_selection_ordinals()
+        self._selected_mask = self._get_selected_mask()
+        changed_mask = previously_selected ^ self._selected_mask
+        for changed_day, btn in self._btn_by_day.items():
+            if (changed_mask >> changed_day) & 1:
+                btn.configure(style=self._get_day_style(changed_day))
     
     def clear_dates(self):
         """Clear date selection and entry fields"""
         self.selected_start_date = None
         self.selected_end_date = None
+        self._update_selection_ordinals()
         self.selecting_range = False
         self.start_date_entry.delete(0, tk.END)
         self.end_date_entry.delete(0, tk.END)
-        self.update_calendar_display()
+        self._schedule_calendar_redraw()
     
     def prev_month(self):
         """Navigate to previous month"""
@@ -2731,7 +3074,7 @@ class ModernTravelCalendar:
             self.current_year -= 1
         else:
             self.current_month -= 1
-        self.update_calendar_display()
+        self._schedule_calendar_redraw()
     
     def next_month(self):
         """Navigate to next month"""
@@ -2740,10 +3083,13 @@ class ModernTravelCalendar:
             self.current_year += 1
         else:
             self.current_month += 1
-        self.update_calendar_display()
+        self._schedule_calendar_redraw()
     
     def add_travel(self):
         """Add a new travel record or update existing one if in edit mode - with enhanced validation"""
+        # Overlap checks need the saved records, so wait for them if the file is still loading
+        self._finish_loading()
+        
         # Collect all validation errors and warnings
         all_errors = []
         all_warnings = []
@@ -2848,38 +3194,37 @@ class ModernTravelCalendar:
         
         # Create record
         record = {
-            'start_date': start_date.strftime('%Y-%m-%d'),
-            'end_date': end_date.strftime('%Y-%m-%d'),
+            'start_date': start_date.date().isoformat(),
+            'end_date': end_date.date().isoformat(),
             'location': location,
             'travel_type': travel_type,  # NEW: Include travel type
             'comment': comment
         }
+        self._hydrate_record(record)
         
         if self.edit_mode and self.edit_index is not None:
             # Update existing record
+            self._count_location(self.travel_records[self.edit_index]['location'], -1)
             self.travel_records[self.edit_index] = record
             self.edit_mode = False
             self.edit_index = None
+            self._count_location(record['location'], 1)
+            self._rebuild_travel_index()
             success_message = "✅ Travel record updated successfully!"
         else:
             # Add new record
             self.travel_records.append(record)
+            self._index_record(record)
             success_message = "✅ Travel record added successfully!"
         
         self.save_data()
-        self.update_calendar_display()
+        self._schedule_calendar_redraw()
         self.update_location_dropdown()
         
-        # Update statistics cards if report window is open
-        self.update_statistics_cards()
-        
-        # Update year dropdown in report window if it's open
-        if (hasattr(self, '_current_year_combo') and hasattr(self, '_current_year_var') and 
-            hasattr(self, '_current_filter_vars') and hasattr(self, '_current_records_tree') and
-            hasattr(self, '_current_search_var') and hasattr(self, '_current_travel_type_var') and
-            self.report_window and self.report_window.winfo_exists()):
-            self.update_year_dropdown(self._current_year_combo, self._current_year_var, 
-                                     self._current_filter_vars, self._current_records_tree, self._current_search_var, self._current_travel_type_var)
+        # Refresh the report if it is showing (a hidden report is refreshed when it is reopened)
+        if (self.report_window and self.report_window.winfo_exists() and
+            self.report_window.state() != 'withdrawn'):
+            self._refresh_report()
         
         self.clear_form()
         
@@ -2896,11 +3241,36 @@ class ModernTravelCalendar:
         self.edit_index = None
     
     def get_record_color_tag(self, record):
-        """Determine the color tag for a record based on its date range"""
-        current_date = datetime.now().date()
-        start_date = datetime.strptime(record['start_date'], '%Y-%m-%d').date()
-        end_date = datetime.strptime(record['end_date'], '%Y-%m-%d').date()
-        
+        """Determine the color tag for a record based on its date range (cached on the record)"""
+        tag = record.get('_color_tag')
+        if tag is None:
+            tag = self._color_tag_for_range(record['_start_dt'], record['_end_dt'], date.today())
+            record['_color_tag'] = tag
+            
+            # Last day (as an ordinal) the tag holds: past trips stay past, current trips
+            # turn past after their end date and future trips turn current on their start date
+            if tag == 'past':
+                record['_color_tag_valid_until'] = date.max.toordinal()
+            elif tag == 'current':
+                record['_color_tag_valid_until'] = record['_end_dt'].toordinal()
+            else:
+                record['_color_tag_valid_until'] = record['_start_dt'].toordinal() - 1
+        return tag
+    
+    def _refresh_color_tags(self):
+        """Drop cached record color tags that have expired since the day they were last checked"""
+        today = date.today()
+        if today != self._color_tag_date:
+            today_ord = today.toordinal()
+            for record in self.travel_records:
+                if '_color_tag' in record and record['_color_tag_valid_until'] < today_ord:
+                    del record['_color_tag']
+                    self._color_tags_version += 1
+            self._color_tag_date = today
+    
+    @staticmethod
+    def _color_tag_for_range(start_date: date, end_date: date, current_date: date) -> str:
+        """Classify a date range relative to the current date"""
         if end_date < current_date:
             return 'past'
         elif start_date <= current_date <= end_date:
@@ -2908,6 +3278,47 @@ class ModernTravelCalendar:
         else:
             return 'future'
     
+    def _refresh_today(self) -> date:
+        """Return today's date, recomputing the cached ordinals derived from it when the day changes"""
+        today = date.today()
+        if today != self._today:
+            self._today = today
+            self._today_ord = today.toordinal()
+            self._year_start_ord = date(today.year, 1, 1).toordinal()
+            self._year_end_ord = date(today.year, 12, 31).toordinal()
+            self._days_in_year_so_far = self._today_ord - self._year_start_ord + 1
+        return today
+    
+    def _get_records_with_status(self, statuses: List[str], year: Optional[int] = None) -> List[Dict]:
+        """Get records whose past/current/future status is in statuses (and that overlap year, if given)"""
+        self._refresh_today()
+        today = self._today_ord
+        if year is not None:
+            year_start = date(year, 1, 1).toordinal()
+            year_end = date(year, 12, 31).toordinal()
+        
+        # One pass over the parallel ordinal lists, touching the record dicts only for matches
+        matches = []
+        for record, trip_start, trip_end in zip(self.travel_records, self._starts, self._ends):
+            if trip_end < trip_start:
+                # Skip records with invalid dates
+                continue
+            
+            # Include record only if it overlaps with the selected year
+            if year is not None and (trip_start > year_end or trip_end < year_start):
+                continue
+            
+            if trip_end < today:
+                status = 'past'
+            elif trip_start <= today:
+                status = 'current'
+            else:
+                status = 'future'
+            
+            if status in statuses:
+                matches.append(record)
+        return matches
+    
     def configure_treeview_tags(self, records_tree):
         """Configure modern color tags for the treeview"""
         records_tree.tag_configure('past', 
@@ -2920,15 +3331,19 @@ class ModernTravelCalendar:
                                   background='#fef3c7', 
                                   foreground='#d97706')
     
-    def update_records_display_filtered(self, records_tree, filter_vars, year_var=None, search_var=None, travel_type_var=None):
-        """Update the travel records display with filtering applied"""
-        # Clear existing items
-        for item in records_tree.get_children():
-            records_tree.delete(item)
+    def _schedule_filter_refresh(self, records_tree, filter_vars, year_var=None, search_var=None, travel_type_var=None):
+        """Refresh the filtered records display shortly, replacing any refresh already pending"""
+        if self._filter_refresh_after_id is not None:
+            self.root.after_cancel(self._filter_refresh_after_id)
         
-        # Configure color tags
-        self.configure_treeview_tags(records_tree)
+        def refresh():
+            self._filter_refresh_after_id = None
+            self.update_records_display_filtered(records_tree, filter_vars, year_var, search_var, travel_type_var)
         
+        self._filter_refresh_after_id = self.root.after(40, refresh)
+    
+    def update_records_display_filtered(self, records_tree, filter_vars, year_var=None, search_var=None, travel_type_var=None):
+        """Update the travel records display with filtering applied"""
         # Get enabled filters
         enabled_filters = []
         if filter_vars['past'].get():
@@ -2940,6 +3355,7 @@ class ModernTravelCalendar:
         
         # If no filters are enabled, show nothing
         if not enabled_filters:
+            self._show_record_rows(records_tree, [])
             return
         
         # Get selected year
@@ -2963,26 +3379,9 @@ class ModernTravelCalendar:
             if search_text == "search locations, dates, or notes...":
                 search_text = ""
         
-        # Filter records
+        # Filter records (status and year filters are applied while classifying)
         filtered_records = []
-        for record in self.travel_records:
-            # Check status filter
-            record_type = self.get_record_color_tag(record)
-            if record_type not in enabled_filters:
-                continue
-            
-            # Check year filter
-            if selected_year is not None:
-                try:
-                    start_date = datetime.strptime(record['start_date'], '%Y-%m-%d')
-                    end_date = datetime.strptime(record['end_date'], '%Y-%m-%d')
-                    
-                    # Include record if it overlaps with the selected year
-                    if not (start_date.year <= selected_year <= end_date.year):
-                        continue
-                except:
-                    continue
-            
+        for record in self._get_records_with_status(enabled_filters, selected_year):
             # Check travel type filter (NEW)
             if selected_travel_type is not None:
                 record_travel_type = record.get('travel_type', 'Personal')  # Default to Personal for backward compatibility
@@ -2996,7 +3395,7 @@ class ModernTravelCalendar:
                     record['location'].lower() + " " +
                     record['start_date'].lower() + " " +
                     record['end_date'].lower() + " " +
-                    record.get('comment', '').lower() + " " +
+                    (record.get('comment') or '').lower() + " " +
                     record.get('travel_type', 'Personal').lower()
                 )
                 
@@ -3007,75 +3406,22 @@ class ModernTravelCalendar:
         
         # Apply sorting if there is an active sort column
         if self.sort_column:
-            # Define sort keys for different columns
-            def sort_key(record):
-                if self.sort_column == 'Start':
-                    return record['start_date']
-                elif self.sort_column == 'End':
-                    return record['end_date']
-                elif self.sort_column == 'Days':
-                    return self.calculate_trip_days(record['start_date'], record['end_date'])
-                elif self.sort_column == 'Location':
-                    return record['location'].lower()
-                return ''
-            
-            # Sort the filtered records
-            filtered_records = sorted(filtered_records, key=sort_key, reverse=self.sort_reverse)
+            # Sort the filtered records (they always have valid cached dates). Descending order is the
+            # ascending order reversed, not a stable reverse sort, so it matches sort_records' flip
+            filtered_records.sort(key=self._SORT_KEYS[self.sort_column])
+            if self.sort_reverse:
+                filtered_records.reverse()
         else:
             # Default sort by start date (oldest first) when no column sorting is active
-            filtered_records = sorted(filtered_records, key=lambda x: x['start_date'], reverse=False)
+            filtered_records.sort(key=itemgetter('start_date'))
         
-        # Add filtered records to tree
-        for record in filtered_records:
-            # Calculate days for the trip
-            days = self.calculate_trip_days(record['start_date'], record['end_date'])
-            
-            # Truncate comment if it's too long for display
-            comment = record.get('comment', '')
-            if len(comment) > 50:
-                comment = comment[:47] + "..."
-            
-            # Get the appropriate color tag
-            color_tag = self.get_record_color_tag(record)
-            
-            records_tree.insert('', tk.END, values=(
-                self.format_date_for_display(record['start_date']),
-                self.format_date_for_display(record['end_date']),
-                str(days),
-                record['location'],
-                comment
-            ), tags=(color_tag,))
+        # Show filtered records in the tree
+        self._show_record_rows(records_tree, filtered_records)
     
     def update_records_display(self, records_tree):
         """Update the travel records display in the report window"""
-        # Clear existing items
-        for item in records_tree.get_children():
-            records_tree.delete(item)
-        
-        # Configure color tags
-        self.configure_treeview_tags(records_tree)
-        
-        # Add records sorted by start date (oldest first)
-        sorted_records = sorted(self.travel_records, key=lambda x: x['start_date'], reverse=False)
-        for record in sorted_records:
-            # Calculate days for the trip
-            days = self.calculate_trip_days(record['start_date'], record['end_date'])
-            
-            # Truncate comment if it's too long for display
-            comment = record.get('comment', '')
-            if len(comment) > 50:
-                comment = comment[:47] + "..."
-            
-            # Get the appropriate color tag
-            color_tag = self.get_record_color_tag(record)
-            
-            records_tree.insert('', tk.END, values=(
-                self.format_date_for_display(record['start_date']),
-                self.format_date_for_display(record['end_date']),
-                str(days),
-                record['location'],
-                comment
-            ), tags=(color_tag,))
+        # Show records sorted by start date (oldest first) - the index keeps them in that order
+        self._show_record_rows(records_tree, self._records_by_start)
     
     def edit_record(self, records_tree, report_window=None):
         """Edit selected travel record by populating main window"""
@@ -3087,67 +3433,45 @@ class ModernTravelCalendar:
                 self.report_window.focus_force()
             return
         
-        item = selection[0]
-        values = records_tree.item(item, 'values')
+        i = self._record_index_for_row(selection[0])
+        record = self.travel_records[i]
         
-        # Find the actual record index
-        start_date_display = values[0]
-        end_date_display = values[1]
-        days_display = values[2]  # New: days column
-        location_str = values[3]  # Updated index
-        comment_display = values[4]  # Updated index
+        # Populate main window with record data
+        self.start_date_entry.delete(0, tk.END)
+        self.start_date_entry.insert(0, self.format_date_for_entry(record['start_date']))
         
-        # Convert display dates back to storage format for matching
-        start_date_storage = self.parse_display_date_to_storage(start_date_display)
-        end_date_storage = self.parse_display_date_to_storage(end_date_display)
+        self.end_date_entry.delete(0, tk.END)
+        self.end_date_entry.insert(0, self.format_date_for_entry(record['end_date']))
         
-        # Find the matching record
-        for i, record in enumerate(self.travel_records):
-            record_comment = record.get('comment', '')
-            display_comment = record_comment[:47] + "..." if len(record_comment) > 50 else record_comment
-            
-            if (record['start_date'] == start_date_storage and 
-                record['end_date'] == end_date_storage and 
-                record['location'] == location_str and
-                display_comment == comment_display):
-                
-                # Populate main window with record data
-                self.start_date_entry.delete(0, tk.END)
-                self.start_date_entry.insert(0, self.format_date_for_entry(record['start_date']))
-                
-                self.end_date_entry.delete(0, tk.END)
-                self.end_date_entry.insert(0, self.format_date_for_entry(record['end_date']))
-                
-                self.location_entry.delete(0, tk.END)
-                self.location_entry.insert(0, record['location'])
-                
-                # Set travel type (NEW)
-                travel_type = record.get('travel_type', 'Personal')  # Default to Personal for backward compatibility
-                self.travel_type_entry.set(travel_type)
-                
-                self.comment_text.delete(1.0, tk.END)
-                self.comment_text.insert(1.0, record.get('comment', ''))
-                
-                # Set selected dates for calendar display
-                self.selected_start_date = datetime.strptime(record['start_date'], '%Y-%m-%d')
-                self.selected_end_date = datetime.strptime(record['end_date'], '%Y-%m-%d')
-                self.selecting_range = False
-                
-                # Navigate calendar to the start date's month/year
-                start_date_obj = datetime.strptime(record['start_date'], '%Y-%m-%d')
-                self.current_month = start_date_obj.month
-                self.current_year = start_date_obj.year
-                
-                # Set edit mode
-                self.edit_mode = True
-                self.edit_index = i
-                
-                # Update calendar display and close report window
-                self.update_calendar_display()
-                self._on_report_window_close()
-                
-                messagebox.showinfo("Edit Mode", "✏️ Record loaded for editing. Calendar navigated to travel dates. Click 'Save Travel' to update.")
-                break
+        self.location_entry.delete(0, tk.END)
+        self.location_entry.insert(0, record['location'])
+        
+        # Set travel type (NEW)
+        travel_type = record.get('travel_type', 'Personal')  # Default to Personal for backward compatibility
+        self.travel_type_entry.set(travel_type)
+        
+        self.comment_text.delete(1.0, tk.END)
+        self.comment_text.insert(1.0, record.get('comment') or '')
+        
+        # Set selected dates for calendar display
+        self.selected_start_date = datetime.combine(record['_start_dt'], datetime.min.time())
+        self.selected_end_date = datetime.combine(record['_end_dt'], datetime.min.time())
+        self._update_selection_ordinals()
+        self.selecting_range = False
+        
+        # Navigate calendar to the start date's month/year
+        self.current_month = self.selected_start_date.month
+        self.current_year = self.selected_start_date.year
+        
+        # Set edit mode
+        self.edit_mode = True
+        self.edit_index = i
+        
+        # Update calendar display and close report window
+        self._schedule_calendar_redraw()
+        self._on_report_window_close()
+        
+        messagebox.showinfo("Edit Mode", "✏️ Record loaded for editing. Calendar navigated to travel dates. Click 'Save Travel' to update.")
     
     def update_year_dropdown(self, year_combo, year_var, filter_vars, records_tree, search_var=None, travel_type_var=None):
         """Update the year dropdown with current available years"""
@@ -3184,28 +3508,18 @@ class ModernTravelCalendar:
             return
         
         if messagebox.askyesno("Confirm", "🗑️ Are you sure you want to delete this record?"):
-            item = selection[0]
-            values = records_tree.item(item, 'values')
-            
-            # Convert display dates back to storage format for matching
-            start_date_storage = self.parse_display_date_to_storage(values[0])
-            end_date_storage = self.parse_display_date_to_storage(values[1])
-            # Note: values[2] is days column, values[3] is location, values[4] is comment
-            
-            # Find and remove the record
-            for i, record in enumerate(self.travel_records):
-                record_comment = record.get('comment', '')
-                display_comment = record_comment[:47] + "..." if len(record_comment) > 50 else record_comment
-                
-                if (record['start_date'] == start_date_storage and 
-                    record['end_date'] == end_date_storage and 
-                    record['location'] == values[3] and
-                    display_comment == values[4]):
-                    del self.travel_records[i]
-                    break
+            i = self._record_index_for_row(selection[0])
+            record = self.travel_records[i]
+            rows_current = self._rows_key is not None and self._rows_key[1] == self._records_version
+            self._count_location(record['location'], -1)
+            del self.travel_records[i]
             
             self.save_data()
-            self.update_calendar_display()
+            self._rebuild_travel_index()
+            if rows_current:
+                # Only this record's row goes away, so drop it instead of rebuilding every row
+                self._drop_record_row(record)
+            self._schedule_calendar_redraw()
             self.update_location_dropdown()
             
             # Update statistics cards if report window is open
@@ -3230,9 +3544,15 @@ class ModernTravelCalendar:
         # Toggle sort direction if clicking the same column
         if self.sort_column == column:
             self.sort_reverse = not self.sort_reverse
-        else:
-            self.sort_column = column
-            self.sort_reverse = False
+            self.update_column_headers(records_tree, column)
+            
+            # The visible rows are already sorted on this column, so just flip their order
+            # (tied rows flip too, as they do when the filters re-sort a descending column)
+            records_tree.set_children('', *reversed(records_tree.get_children()))
+            return
+        
+        self.sort_column = column
+        self.sort_reverse = False
         
         # Update column heading to show sort direction
         self.update_column_headers(records_tree, column)
@@ -3249,33 +3569,75 @@ class ModernTravelCalendar:
     
     def update_records_display_sorted(self, records_tree, sorted_records):
         """Update the travel records display with sorted records"""
-        # Clear existing items
-        for item in records_tree.get_children():
-            records_tree.delete(item)
-        
-        # Configure color tags
-        self.configure_treeview_tags(records_tree)
-        
-        # Add sorted records
-        for record in sorted_records:
-            # Calculate days for the trip
-            days = self.calculate_trip_days(record['start_date'], record['end_date'])
-            
-            # Truncate comment if it's too long for display
-            comment = record.get('comment', '')
-            if len(comment) > 50:
-                comment = comment[:47] + "..."
-            
-            # Get the appropriate color tag
-            color_tag = self.get_record_color_tag(record)
+        self._show_record_rows(records_tree, sorted_records)
+    
+    def _show_record_rows(self, records_tree, records):
+        """Show the given records, in order, as the rows of the records treeview"""
+        # Rows for every record are built once and then just re-attached in filter/sort order;
+        # they are rebuilt only when the records, a record's color tag or the date format change
+        self._refresh_color_tags()
+        rows_key = (records_tree, self._records_version, self._color_tags_version,
+                    self.validation_settings.get('report_date_format'))
+        if rows_key != self._rows_key:
+            if self._rows_key is not None and self._rows_key[0] is records_tree:
+                # Delete the old rows, including any a filter currently has detached
+                records_tree.delete(*self._row_iids.values())
+            self._insert_record_rows(records_tree)
+            self._rows_key = rows_key
+        
+        # Replacing the root's children detaches every row not listed, in a single Tk call
+        row_iids = self._row_iids
+        records_tree.set_children('', *[row_iids[id(record)] for record in records
+                                        if id(record) in row_iids])
+    
+    def _record_index_for_row(self, iid: str) -> int:
+        """Get the travel_records index of the record shown in a records treeview row"""
+        return self._record_index[id(self._row_records[iid])]
+    
+    def _drop_record_row(self, record: Dict):
+        """Delete a removed record's row and keep the remaining rows valid for the current records"""
+        records_tree = self._rows_key[0]
+        iid = self._row_iids.pop(id(record), None)
+        if iid is not None:
+            del self._row_records[iid]
+            records_tree.delete(iid)
+        self._rows_key = (records_tree, self._records_version) + self._rows_key[2:]
+    
+    def _insert_record_rows(self, records_tree):
+        """Insert a row for every record that has valid dates into an empty records treeview"""
+        self._row_iids = {}
+        self._row_records = {}
+        
+        # Collect (iid, values, tag) triples, back to front so they can be inserted at index 0 -
+        # Tk walks the whole sibling list to find 'end'
+        rows = []
+        for index in range(len(self.travel_records) - 1, -1, -1):
+            record = self.travel_records[index]
+            if record['_start_dt'] is None:
+                # Skip records with invalid dates
+                continue
             
-            records_tree.insert('', tk.END, values=(
+            # Key rows by record rather than position so deleting a record leaves the other rows valid
+            iid = str(id(record))
+            self._row_iids[id(record)] = iid
+            self._row_records[iid] = record
+            rows.extend((iid, (
                 self.format_date_for_display(record['start_date']),
                 self.format_date_for_display(record['end_date']),
-                str(days),
+                str(record['_trip_days']),
                 record['location'],
-                comment
-            ), tags=(color_tag,))
+                record['_display_comment']
+            ), self.get_record_color_tag(record)))
+        
+        # Take the tree out of the layout while filling it so Tk does a single layout pass
+        records_tree.grid_remove()
+        try:
+            # Insert every row from one Tcl foreach instead of one Python -> Tcl call per row;
+            # the rows are passed as a Tcl list, so values never need escaping
+            records_tree.tk.call('foreach', ('iid', 'values', 'tag'), tuple(rows),
+                                 f'{records_tree} insert {{}} 0 -id $iid -values $values -tags $tag')
+        finally:
+            records_tree.grid()
     
     def update_column_headers(self, records_tree, sorted_column):
         """Update column headers to show sort indicators"""
@@ -3304,31 +3666,32 @@ class ModernTravelCalendar:
         trips_taken = 0  # count trips_taken (only past and current)
         future_trips = 0  # count future trips
         locations = set()
-        current_date = datetime.now()
-        year_start = datetime(current_date.year, 1, 1)
-        days_in_year_so_far = (current_date - year_start).days + 1
+        current_date = self._refresh_today()
         
-        for record in self.travel_records:
-            start_date = datetime.strptime(record['start_date'], '%Y-%m-%d')
-            end_date = datetime.strptime(record['end_date'], '%Y-%m-%d')
-            
+        # Work in date ordinals so the loop only compares ints from the parallel range lists
+        today = self._today_ord
+        year_start = self._year_start_ord
+        year_end = self._year_end_ord
+        days_in_year_so_far = self._days_in_year_so_far
+        
+        # Records with invalid dates have an empty (1, 0) range and are never counted
+        for record, start_date, end_date in zip(self.travel_records, self._starts, self._ends):
             # Count future trips (trips that haven't started yet)
-            if start_date > current_date:
+            if start_date > today:
                 future_trips += 1
             
             # Only count trips and days in current year
-            if start_date.year <= current_date.year and end_date.year >= current_date.year:
+            if start_date <= year_end and end_date >= year_start:
                 # Only count as a trip if it has already started (past or current travel)
-                if start_date <= current_date:
+                if start_date <= today:
                     trips_taken += 1
                 
                 # Adjust dates to current year if needed
                 count_start = max(start_date, year_start)
-                count_end = min(end_date, current_date)
+                count_end = min(end_date, today)
                 
                 if count_start <= count_end:
-                    days = (count_end - count_start).days + 1
-                    total_days += days
+                    total_days += count_end - count_start + 1
                     locations.add(record['location'])
         
         percentage = (total_days / days_in_year_so_far) * 100 if days_in_year_so_far > 0 else 0
@@ -3344,37 +3707,26 @@ class ModernTravelCalendar:
     
     def calculate_total_travel_days_all_years(self):
         """Calculate total travel days across all years"""
-        total_days = 0
-        for record in self.travel_records:
-            try:
-                start_date = datetime.strptime(record['start_date'], '%Y-%m-%d')
-                end_date = datetime.strptime(record['end_date'], '%Y-%m-%d')
-                days = (end_date - start_date).days + 1
-                total_days += days
-            except ValueError:
-                # Skip records with invalid dates
-                continue
-        return total_days
+        # Records with invalid dates cache a trip length of 0
+        return sum(record['_trip_days'] for record in self.travel_records)
     
     def calculate_total_weekend_days_all_years(self):
         """Calculate total weekend days across all travel records"""
         total_weekend_days = 0
         
         for record in self.travel_records:
-            try:
-                start_date = datetime.strptime(record['start_date'], '%Y-%m-%d')
-                end_date = datetime.strptime(record['end_date'], '%Y-%m-%d')
-                
-                # Count weekend days for this trip
-                current_date = start_date
-                while current_date <= end_date:
-                    if current_date.weekday() in [5, 6]:  # Saturday (5) and Sunday (6)
-                        total_weekend_days += 1
-                    current_date += timedelta(days=1)
-                    
-            except ValueError:
+            start_date = record['_start_dt']
+            end_date = record['_end_dt']
+            if start_date is None:
                 # Skip records with invalid dates
                 continue
+            
+            # Count weekend days for this trip
+            current_date = start_date
+            while current_date <= end_date:
+                if current_date.weekday() in [5, 6]:  # Saturday (5) and Sunday (6)
+                    total_weekend_days += 1
+                current_date += timedelta(days=1)
         
         return total_weekend_days
     
@@ -3383,19 +3735,17 @@ class ModernTravelCalendar:
         month_days = {}
         
         for record in self.travel_records:
-            try:
-                start_date = datetime.strptime(record['start_date'], '%Y-%m-%d')
-                end_date = datetime.strptime(record['end_date'], '%Y-%m-%d')
-                
-                # Iterate through each day of the trip
-                current_date = start_date
-                while current_date <= end_date:
-                    month_name = current_date.strftime('%B')  # Full month name
-                    month_days[month_name] = month_days.get(month_name, 0) + 1
-                    current_date += timedelta(days=1)
-                    
-            except ValueError:
+            start_date = record['_start_dt']
+            end_date = record['_end_dt']
+            if start_date is None:
                 continue
+            
+            # Iterate through each day of the trip
+            current_date = start_date
+            while current_date <= end_date:
+                month_name = current_date.strftime('%B')  # Full month name
+                month_days[month_name] = month_days.get(month_name, 0) + 1
+                current_date += timedelta(days=1)
         
         if not month_days:
             return "None"
@@ -3421,6 +3771,20 @@ class ModernTravelCalendar:
         
         return month_abbreviations.get(peak_month, peak_month)
     
+    def _create_stat_card(self, parent, column: int, padx, bg: str, icon: str, value_text: str, caption: str) -> tk.Label:
+        """Create a report statistics card and return its value label"""
+        card = tk.Frame(parent, bg=bg, relief='solid', bd=0, padx=16, pady=12)
+        card.grid(row=0, column=column, sticky=(tk.W, tk.E), padx=padx)
+        
+        tk.Label(card, text=icon, font=('Segoe UI', 20),
+                bg=bg, fg='white', anchor='center', justify='center').pack()
+        value_label = tk.Label(card, text=value_text, font=('Segoe UI', 24, 'bold'),
+                bg=bg, fg='white')
+        value_label.pack()
+        tk.Label(card, text=caption, font=('Segoe UI', 10),
+                bg=bg, fg='white').pack()
+        return value_label
+    
     def update_statistics_cards(self):
         """Update the statistics cards in the report window"""
         if not (self.report_window and self.report_window.winfo_exists() and 
@@ -3437,14 +3801,33 @@ class ModernTravelCalendar:
         self._stats_labels['percentage'].config(text=f"{stats['percentage']:.1f}%")
         self._stats_labels['locations'].config(text=str(stats['locations_count']))
     
+    def _refresh_report(self):
+        """Refresh the report window's statistics cards, year filter and records list"""
+        self.update_statistics_cards()
+        
+        if (hasattr(self, '_current_year_combo') and hasattr(self, '_current_year_var') and 
+            hasattr(self, '_current_filter_vars') and hasattr(self, '_current_records_tree') and
+            hasattr(self, '_current_search_var') and hasattr(self, '_current_travel_type_var')):
+            self.update_year_dropdown(self._current_year_combo, self._current_year_var, 
+                                     self._current_filter_vars, self._current_records_tree, self._current_search_var, self._current_travel_type_var)
+    
     def show_report(self):
         """Show modern travel report in a new window"""
+        # The menu and Ctrl+R stay enabled while loading, so wait for the records here
+        self._finish_loading()
         if not self.travel_records:
             messagebox.showinfo("Report", "📈 No travel records found.")
             return
         
         # Check if report window already exists
         if self.report_window and self.report_window.winfo_exists():
+            if self.report_window.state() == 'withdrawn':
+                # Reopen the hidden report as if it were new: default filters and sorting,
+                # picking up any changes made while it was closed
+                self.report_window.deiconify()
+                self._reset_report_filters()
+                self._refresh_report()
+            
             # Bring existing window to front
             self.report_window.lift()
             self.report_window.focus_force()
@@ -3489,65 +3872,21 @@ class ModernTravelCalendar:
         # Initialize dictionary to store label references
         self._stats_labels = {}
         
-        # Trips Taken card 
-        trips_card = tk.Frame(stats_frame, bg='#EA3680', relief='solid', bd=0, padx=16, pady=12)
-        trips_card.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, 4))
-        
-        tk.Label(trips_card, text="🚀", font=('Segoe UI', 20), 
-                bg='#EA3680', fg='white', anchor='center', justify='center').pack()
-        self._stats_labels['trips_taken'] = tk.Label(trips_card, text=str(stats['trips_taken']), font=('Segoe UI', 24, 'bold'),
-                bg='#EA3680', fg='white')
-        self._stats_labels['trips_taken'].pack()
-        tk.Label(trips_card, text=f"Trips Taken ({stats['current_year']})", font=('Segoe UI', 10),
-                bg='#EA3680', fg='white').pack()
-        
-        # Future trips card (second position)
-        future_card = tk.Frame(stats_frame, bg='#E5B32D', relief='solid', bd=0, padx=16, pady=12)
-        future_card.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=4)
-        
-        tk.Label(future_card, text=" 📅 ", font=('Segoe UI', 20),
-                bg='#E5B32D', fg='white', anchor='center').pack()
-        self._stats_labels['future_trips'] = tk.Label(future_card, text=str(stats['future_trips']), font=('Segoe UI', 24, 'bold'),
-                bg='#E5B32D', fg='white')
-        self._stats_labels['future_trips'].pack()
-        tk.Label(future_card, text="Upcoming Trips", font=('Segoe UI', 10),
-                bg='#E5B32D', fg='white').pack()
-        
-        # Days traveled card (moved to third position)
-        days_card = tk.Frame(stats_frame, bg=self.colors['primary'], relief='solid', bd=0, padx=16, pady=12)
-        days_card.grid(row=0, column=2, sticky=(tk.W, tk.E), padx=4)
-        
-        tk.Label(days_card, text="✈️", font=('Segoe UI', 20), 
-                bg=self.colors['primary'], fg='white', anchor='center', justify='center').pack()
-        self._stats_labels['total_days'] = tk.Label(days_card, text=str(stats['total_days']), font=('Segoe UI', 24, 'bold'),
-                bg=self.colors['primary'], fg='white')
-        self._stats_labels['total_days'].pack()
-        tk.Label(days_card, text=f"Days Traveled ({stats['current_year']})", font=('Segoe UI', 10),
-                bg=self.colors['primary'], fg='white').pack()
-        
-        # Percentage card (moved to fourth position)
-        percent_card = tk.Frame(stats_frame, bg=self.colors['success'], relief='solid', bd=0, padx=16, pady=12)
-        percent_card.grid(row=0, column=3, sticky=(tk.W, tk.E), padx=4)
-        
-        tk.Label(percent_card, text="📈", font=('Segoe UI', 20),
-                bg=self.colors['success'], fg='white', anchor='center', justify='center').pack()
-        self._stats_labels['percentage'] = tk.Label(percent_card, text=f"{stats['percentage']:.1f}%", font=('Segoe UI', 24, 'bold'),
-                bg=self.colors['success'], fg='white')
-        self._stats_labels['percentage'].pack()
-        tk.Label(percent_card, text="Percentage of Year", font=('Segoe UI', 10),
-                bg=self.colors['success'], fg='white').pack()
-        
-        # Locations card (moved to fifth position)
-        locations_card = tk.Frame(stats_frame, bg=self.colors['accent'], relief='solid', bd=0, padx=16, pady=12)
-        locations_card.grid(row=0, column=4, sticky=(tk.W, tk.E), padx=(4, 0))
-        
-        tk.Label(locations_card, text="🌍", font=('Segoe UI', 20),
-                bg=self.colors['accent'], fg='white', anchor='center', justify='center').pack()
-        self._stats_labels['locations'] = tk.Label(locations_card, text=str(stats['locations_count']), font=('Segoe UI', 24, 'bold'),
-                bg=self.colors['accent'], fg='white')
-        self._stats_labels['locations'].pack()
-        tk.Label(locations_card, text="Locations Visited ", font=('Segoe UI', 10),
-                bg=self.colors['accent'], fg='white').pack()
+        # Statistics cards: (stats key, icon, value text, caption, background, horizontal padding)
+        stat_cards = (
+            ('trips_taken', "🚀", str(stats['trips_taken']), f"Trips Taken ({stats['current_year']})",
+             '#EA3680', (0, 4)),
+            ('future_trips', " 📅 ", str(stats['future_trips']), "Upcoming Trips",
+             '#E5B32D', 4),
+            ('total_days', "✈️", str(stats['total_days']), f"Days Traveled ({stats['current_year']})",
+             self.colors['primary'], 4),
+            ('percentage', "📈", f"{stats['percentage']:.1f}%", "Percentage of Year",
+             self.colors['success'], 4),
+            ('locations', "🌍", str(stats['locations_count']), "Locations Visited ",
+             self.colors['accent'], (4, 0)),
+        )
+        for column, (key, icon, value_text, caption, bg, padx) in enumerate(stat_cards):
+            self._stats_labels[key] = self._create_stat_card(stats_frame, column, padx, bg, icon, value_text, caption)
         
         # Filter section
         filter_frame = ttk.LabelFrame(main_container, text="☰ Record Filter", style='Card.TLabelframe')
@@ -3638,8 +3977,12 @@ class ModernTravelCalendar:
             # Don't filter if showing placeholder text
             if search_var.get() == placeholder_text:
                 return
-            # Filter records in real time
-            self.update_records_display_filtered(records_tree, filter_vars, year_var, search_var, travel_type_var)
+            # Filter records in real time (coalescing fast typing into one refresh)
+            self._schedule_filter_refresh(records_tree, filter_vars, year_var, search_var, travel_type_var)
+        
+        def on_filter_var_change(*args):
+            # Any status flag write (toggle or programmatic) schedules a single coalesced refresh
+            self._schedule_filter_refresh(records_tree, filter_vars, year_var, search_var, travel_type_var)
         
         def on_travel_type_change(event):
             # Filter records when travel type changes
@@ -3653,6 +3996,8 @@ class ModernTravelCalendar:
         search_entry.bind('<FocusIn>', on_search_focus_in)
         search_entry.bind('<FocusOut>', on_search_focus_out)
         search_var.trace('w', on_search_change)
+        for var in filter_vars.values():
+            var.trace_add('write', on_filter_var_change)
         travel_type_combo.bind('<<ComboboxSelected>>', on_travel_type_change)
         
         # Year and Status filters (second row - below Search and Travel Type)
@@ -3673,10 +4018,8 @@ class ModernTravelCalendar:
             def toggle_state():
                 # Toggle the variable
                 filter_vars[var_name].set(not filter_vars[var_name].get())
-                # Update button appearance
+                # Update button appearance (the variable trace refreshes the records)
                 update_button_appearance()
-                # Update records display
-                self.update_records_display_filtered(records_tree, filter_vars, year_var, search_var, travel_type_var)
             
             # Create the button
             btn = tk.Button(parent, text=text,
@@ -3782,8 +4125,8 @@ class ModernTravelCalendar:
                 except ValueError:
                     pass
             
-            # Update the records display
-            self.update_records_display_filtered(records_tree, filter_vars, year_var, search_var, travel_type_var)
+            # Update the records display (shares one refresh with any toggle flipped above)
+            self._schedule_filter_refresh(records_tree, filter_vars, year_var, search_var, travel_type_var)
         
         year_combo.bind('<<ComboboxSelected>>', on_year_change)
         
@@ -3823,6 +4166,9 @@ class ModernTravelCalendar:
         scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=records_tree.yview)
         records_tree.configure(yscrollcommand=scrollbar.set)
         
+        # Tag styles never change, so configure them once per tree
+        self.configure_treeview_tags(records_tree)
+        
         records_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
@@ -3832,6 +4178,22 @@ class ModernTravelCalendar:
         # Store search variable reference
         self._current_search_var = search_var
         
+        def reset_filters():
+            """Put the filters and sorting back to the defaults the report opens with"""
+            for name, var in filter_vars.items():
+                var.set(self.validation_settings[f'default_show_{name}'])
+            update_button_appearance()
+            search_var.set(placeholder_text)
+            search_entry.config(fg=self.colors['text_light'])
+            travel_type_var.set(self.validation_settings.get('default_travel_type_filter', 'All'))
+            year_var.set(self.get_default_year_selection(self.get_available_years()))
+            self.sort_column = None
+            self.sort_reverse = False
+            self.update_column_headers(records_tree, None)
+        
+        # Used by show_report when the hidden window is reopened
+        self._reset_report_filters = reset_filters
+        
         # Initial records display with filtering
         self.update_records_display_filtered(records_tree, filter_vars, year_var, search_var, travel_type_var)
         
@@ -3884,20 +4246,21 @@ class ModernTravelCalendar:
         current_year = datetime.now().year
         years = set()
         
+        today = date.today()
+        
         for record in self.travel_records:
-            try:
-                start_date = datetime.strptime(record['start_date'], '%Y-%m-%d')
-                end_date = datetime.strptime(record['end_date'], '%Y-%m-%d')
-                
-                # Include years for trips that have started (past or current)
-                if start_date <= datetime.now():
-                    years.add(start_date.year)
-                    years.add(end_date.year)
-                    # Add any years in between for multi-year trips
-                    for year in range(start_date.year, min(end_date.year, current_year) + 1):
-                        years.add(year)
-            except ValueError:
+            start_date = record['_start_dt']
+            end_date = record['_end_dt']
+            if start_date is None:
                 continue
+            
+            # Include years for trips that have started (past or current)
+            if start_date <= today:
+                years.add(start_date.year)
+                years.add(end_date.year)
+                # Add any years in between for multi-year trips
+                for year in range(start_date.year, min(end_date.year, current_year) + 1):
+                    years.add(year)
         
         # Only include years up to current year
         past_years = [year for year in years if year <= current_year]
@@ -3908,20 +4271,22 @@ class ModernTravelCalendar:
         current_year = datetime.now().year
         years = set()
         
+        today = date.today()
+        
         for record in self.travel_records:
-            try:
-                start_date = datetime.strptime(record['start_date'], '%Y-%m-%d')
-                end_date = datetime.strptime(record['end_date'], '%Y-%m-%d')
-                
-                # Include years for trips that start in the future or overlap with future
-                if end_date >= datetime.now():
-                    years.add(start_date.year)
-                    years.add(end_date.year)
-                    # Add any years in between for multi-year trips
-                    for year in range(max(start_date.year, current_year), end_date.year + 1):
-                        years.add(year)
-            except ValueError:
+            start_date = record['_start_dt']
+            end_date = record['_end_dt']
+            if start_date is None:
                 continue
+            
+            # Include years for trips that start in the future or overlap with future
+            # (a trip ending today is already under way, so it doesn't count)
+            if end_date > today:
+                years.add(start_date.year)
+                years.add(end_date.year)
+                # Add any years in between for multi-year trips
+                for year in range(max(start_date.year, current_year), end_date.year + 1):
+                    years.add(year)
         
         # Only include years from current year forward
         future_years = [year for year in years if year >= current_year]
@@ -3982,11 +4347,17 @@ class ModernTravelCalendar:
         # Track total travel days for the future year (including past + future travel)
         total_future_year_days = 0
         
+        midnight = datetime.min.time()
+        
         for record in self.travel_records:
             try:
-                start_date = datetime.strptime(record['start_date'], '%Y-%m-%d')
-                end_date = datetime.strptime(record['end_date'], '%Y-%m-%d')
-                trip_length = (end_date - start_date).days + 1
+                if record['_start_dt'] is None:
+                    # Skip records with invalid dates
+                    continue
+                # Lift the cached dates to midnight datetimes for the comparisons against now below
+                start_date = datetime.combine(record['_start_dt'], midnight)
+                end_date = datetime.combine(record['_end_dt'], midnight)
+                trip_length = record['_trip_days']
                 location = record['location']
                 
                 # Update overall statistics (unchanged)
@@ -4118,6 +4489,7 @@ class ModernTravelCalendar:
     
     def show_analytics_dashboard(self):
         """Show comprehensive analytics dashboard in a new window"""
+        self._finish_loading()
         if not self.travel_records:
             messagebox.showinfo("Analytics", "📈 No travel records found for analytics.")
             return
@@ -4255,7 +4627,7 @@ class ModernTravelCalendar:
                              font=('Segoe UI', 10, 'bold'),
                              relief='flat', bd=0, padx=12, pady=8,
                              activebackground='#475569', activeforeground='white',
-                             command=analytics_window.destroy)
+                             command=self._on_analytics_window_close)
         close_btn.pack()
     
     def update_overall_statistics(self, overall_content, overall_data):
@@ -4419,25 +4791,9 @@ class ModernTravelCalendar:
 
     def _on_report_window_close(self):
         """Handle report window close event"""
+        # Hide rather than destroy so reopening the report reuses its widgets and rows
         if self.report_window:
-            self.report_window.destroy()
-            self.report_window = None
-                       
-        # Clear stored references
-        if hasattr(self, '_current_year_combo'):
-            delattr(self, '_current_year_combo')
-        if hasattr(self, '_current_year_var'):
-            delattr(self, '_current_year_var')
-        if hasattr(self, '_current_filter_vars'):
-            delattr(self, '_current_filter_vars')
-        if hasattr(self, '_current_records_tree'):
-            delattr(self, '_current_records_tree')
-        if hasattr(self, '_current_search_var'):
-            delattr(self, '_current_search_var')
-        if hasattr(self, '_current_travel_type_var'):
-            delattr(self, '_current_travel_type_var')
-        if hasattr(self, '_stats_labels'):
-            delattr(self, '_stats_labels')
+            self.report_window.withdraw()
 
 def main():
     root = tk.Tk()